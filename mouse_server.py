@@ -6,236 +6,313 @@ Control your computer's mouse from your phone with a beautiful GUI interface
 
 import sys
 import socket
+import functools
+import importlib.util
+import gzip
 import json
+import base64
+import hashlib
+import struct
+import collections
+import queue
 import http.server
 import socketserver
 import threading
 import time
-from datetime import datetime
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QTextEdit, QTabWidget, QFrame, QGridLayout,
-    QSystemTrayIcon, QMenu, QMessageBox, QSplitter, QGroupBox, QScrollArea
+    QSystemTrayIcon, QMenu, QMessageBox, QSplitter, QGroupBox, QTextBrowser, QCheckBox
 )
 from PyQt6.QtCore import QThread, pyqtSignal, QTimer, Qt, QSize
-from PyQt6.QtGui import QIcon, QFont, QPixmap, QPainter, QColor, QAction
+from PyQt6.QtGui import QIcon, QFont, QPixmap, QPainter, QColor, QAction, QTextCursor, QPalette
 
-try:
-    from pynput.mouse import Button
-    from pynput import mouse
+# pynput pulls in its platform backend on import, which is slow on Windows, so only
+# check that it is installed here and import it when the server first starts
+PYNPUT_AVAILABLE = importlib.util.find_spec('pynput') is not None
 
-    PYNPUT_AVAILABLE = True
-except ImportError:
-    PYNPUT_AVAILABLE = False
+Key = Button = mouse = KeyboardController = None
+KEY_MAP = {}
+MODIFIER_KEYS = {}
+MOUSE_BUTTONS = {}
 
 
-class MouseControlHandler(http.server.BaseHTTPRequestHandler):
-    """HTTP request handler for mouse control commands"""
-    mouse_controller = None
-    log_callback = None
-
-    @classmethod
-    def set_mouse_controller(cls, controller):
-        cls.mouse_controller = controller
+def load_pynput():
+    """Import pynput and fill in the key and button tables, once"""
+    global Key, Button, mouse, KeyboardController
+    if mouse is not None:
+        return
 
-    @classmethod
-    def set_log_callback(cls, callback):
-        cls.log_callback = callback
+    from pynput.mouse import Button
+    from pynput.keyboard import Key, Controller as KeyboardController
+    from pynput import mouse
 
-    def log(self, message):
-        if self.log_callback:
-            self.log_callback(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+    # Special keys sent by the virtual keyboard
+    KEY_MAP.update({
+        'enter': Key.enter,
+        'backspace': Key.backspace,
+        'space': Key.space,
+        'tab': Key.tab,
+        'escape': Key.esc,
+        'shift': Key.shift,
+        'ctrl': Key.ctrl,
+        'alt': Key.alt,
+        'up': Key.up,
+        'down': Key.down,
+        'left': Key.left,
+        'right': Key.right,
+        'home': Key.home,
+        'end': Key.end,
+        'page_up': Key.page_up,
+        'page_down': Key.page_down,
+        'delete': Key.delete,
+        'f1': Key.f1, 'f2': Key.f2, 'f3': Key.f3, 'f4': Key.f4,
+        'f5': Key.f5, 'f6': Key.f6, 'f7': Key.f7, 'f8': Key.f8,
+        'f9': Key.f9, 'f10': Key.f10, 'f11': Key.f11, 'f12': Key.f12
+    })
+
+    # Modifier names accepted in key combinations like "ctrl+c"
+    MODIFIER_KEYS.update({'ctrl': Key.ctrl, 'shift': Key.shift, 'alt': Key.alt})
+
+    # Button names sent by the phone
+    MOUSE_BUTTONS.update({'left': Button.left, 'right': Button.right, 'middle': Button.middle})
 
-    def do_GET(self):
-        """Serve the HTML interface"""
-        if self.path == '/' or self.path == '/index.html':
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
 
-            html_content = self.get_html_interface()
-            self.wfile.write(html_content.encode('utf-8'))
-            self.log(f"Served interface to {self.client_address[0]}")
-        else:
-            self.send_response(404)
-            self.end_headers()
+try:
+    import orjson
 
-    def do_POST(self):
-        """Handle mouse control commands"""
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    def json_loads(data):
+        return json.loads(data)
+
+    def json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=256)
+def parse_combo(combo):
+    """Resolve a key combination like "ctrl+c" into the keys to press, in order"""
+    return tuple(MODIFIER_KEYS.get(key, key) for key in combo.lower().split('+'))
+
+
+if sys.platform == 'win32':
+    import ctypes
+    from ctypes import wintypes
+
+    INPUT_MOUSE = 0
+    MOUSEEVENTF_WHEEL = 0x0800
+    MOUSEEVENTF_HWHEEL = 0x1000
+    WHEEL_DELTA = 120
+
+    # (down, up) flags for each pynput button name
+    MOUSEEVENTF_BUTTONS = {
+        'left': (0x0002, 0x0004),
+        'right': (0x0008, 0x0010),
+        'middle': (0x0020, 0x0040),
+    }
+
+    class MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ('dx', wintypes.LONG),
+            ('dy', wintypes.LONG),
+            ('mouseData', wintypes.DWORD),
+            ('dwFlags', wintypes.DWORD),
+            ('time', wintypes.DWORD),
+            ('dwExtraInfo', ctypes.c_size_t),
+        ]
 
+    class INPUT(ctypes.Structure):
+        # MOUSEINPUT is the largest member of the Win32 INPUT union
+        _fields_ = [('type', wintypes.DWORD), ('mi', MOUSEINPUT)]
+
+    class Win32Mouse:
+        """Absolute SetCursorPos moves; clicks and wheel steps through prebuilt SendInput calls"""
+
+        def __init__(self):
+            user32 = ctypes.WinDLL('user32', use_last_error=True)
+            self._send_input = user32.SendInput
+            self._input_size = ctypes.sizeof(INPUT)
+
+            # Relative MOUSEEVENTF_MOVE is scaled by pointer speed and acceleration, so a
+            # move reads the position and sets it absolutely (two calls, as pynput does)
+            self._get_cursor_pos = user32.GetCursorPos
+            self._set_cursor_pos = user32.SetCursorPos
+            self._cursor = wintypes.POINT()
+            self._cursor_ref = ctypes.byref(self._cursor)
+
+            self._wheel = INPUT(type=INPUT_MOUSE)
+            self._wheel_ref = ctypes.byref(self._wheel)
+
+            # Press and release go out together in one call per click
+            self._clicks = {}
+            for name, (down, up) in MOUSEEVENTF_BUTTONS.items():
+                pair = (INPUT * 2)(INPUT(type=INPUT_MOUSE), INPUT(type=INPUT_MOUSE))
+                pair[0].mi.dwFlags = down
+                pair[1].mi.dwFlags = up
+                self._clicks[name] = pair
+
+        def send(self, count, inputs):
+            """Submit prebuilt INPUT records, raising if Windows rejected any"""
+            if self._send_input(count, inputs, self._input_size) != count:
+                raise ctypes.WinError(ctypes.get_last_error())
+
+        def move(self, dx, dy):
+            """Set the cursor to its current position plus exactly (dx, dy) pixels"""
+            if not self._get_cursor_pos(self._cursor_ref):
+                raise ctypes.WinError(ctypes.get_last_error())
+            if not self._set_cursor_pos(self._cursor.x + round(dx), self._cursor.y + round(dy)):
+                raise ctypes.WinError(ctypes.get_last_error())
+
+        def click(self, button):
+            """Press and release a pynput Button"""
+            self.send(2, self._clicks[button.name])
+
+        def scroll(self, dx, dy):
+            """Scroll by whole wheel steps, vertical then horizontal"""
+            for flags, steps in ((MOUSEEVENTF_WHEEL, dy), (MOUSEEVENTF_HWHEEL, dx)):
+                if steps:
+                    self._wheel.mi.dwFlags = flags
+                    # mouseData is a DWORD carrying a signed wheel delta
+                    self._wheel.mi.mouseData = (steps * WHEEL_DELTA) & 0xFFFFFFFF
+                    self.send(1, self._wheel_ref)
+
+
+def create_mouse_backend(controller):
+    """Return the cheapest object with move/click/scroll available on this platform"""
+    if sys.platform == 'win32':
         try:
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            command = json.loads(post_data.decode('utf-8'))
-
-            action = command.get('action')
-
-            if action == 'move':
-                dx = command.get('dx', 0)
-                dy = command.get('dy', 0)
-                # Scale the movement for better control
-                self.move_mouse(dx * 2, dy * 2)
-            elif action == 'click':
-                button = command.get('button', 'left')
-                self.click(button)
-                self.log(f"Click: {button} from {self.client_address[0]}")
-            elif action == 'scroll':
-                direction = command.get('direction', 'up')
-                amount = command.get('amount', 1)
-                self.scroll(direction, amount)
-                self.log(f"Scroll: {direction} (x{amount}) from {self.client_address[0]}")
-            elif action == 'key':
-                key_type = command.get('key_type', 'char')
-                key_value = command.get('key_value', '')
-                self.send_key(key_type, key_value)
-                self.log(f"Key: {key_type}={key_value} from {self.client_address[0]}")
-            elif action == 'zoom':
-                direction = command.get('direction', 'in')
-                self.zoom(direction)
-                self.log(f"Zoom: {direction} from {self.client_address[0]}")
-
-            response = json.dumps({'status': 'ok'})
-            self.wfile.write(response.encode('utf-8'))
-
-        except Exception as e:
-            self.log(f"Error handling command: {e}")
-            response = json.dumps({'status': 'error', 'message': str(e)})
-            self.wfile.write(response.encode('utf-8'))
-
-    def do_OPTIONS(self):
-        """Handle preflight requests"""
-        self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'POST, GET, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        self.end_headers()
+            return Win32Mouse()
+        except (AttributeError, OSError):
+            pass
+    return controller
 
-    def move_mouse(self, dx, dy):
-        """Move mouse relative to current position"""
-        if self.mouse_controller:
-            try:
-                current_x, current_y = self.mouse_controller.position
-                new_x = current_x + dx
-                new_y = current_y + dy
-                self.mouse_controller.position = (new_x, new_y)
-            except Exception as e:
-                self.log(f"Mouse move error: {e}")
 
-    def click(self, button='left'):
-        """Perform mouse click"""
-        if self.mouse_controller:
-            try:
-                if button == 'left':
-                    self.mouse_controller.click(Button.left)
-                elif button == 'right':
-                    self.mouse_controller.click(Button.right)
-                elif button == 'middle':
-                    self.mouse_controller.click(Button.middle)
-            except Exception as e:
-                self.log(f"Mouse click error: {e}")
+class InputWorker(threading.Thread):
+    """Single consumer that applies queued input in arrival order, merging consecutive moves"""
+    _STOP = object()
 
-    def scroll(self, direction, amount=1):
-        """Scroll mouse wheel"""
-        if self.mouse_controller:
-            try:
-                scroll_amount = amount * (1 if direction == 'up' else -1)
-                self.mouse_controller.scroll(0, scroll_amount)
-            except Exception as e:
-                self.log(f"Mouse scroll error: {e}")
+    def __init__(self, move, log_callback=None, rate=120):
+        super().__init__(daemon=True, name='input-worker')
+        self.move_cursor = move
+        self.log_callback = log_callback
+        self.interval = 1.0 / rate
+        # SimpleQueue is Python 3.7+; Queue offers the same put/get on 3.6
+        self._queue = getattr(queue, 'SimpleQueue', queue.Queue)()
 
-    def send_key(self, key_type, key_value):
-        """Send keyboard input"""
-        try:
-            from pynput.keyboard import Key, Controller as KeyboardController
-            keyboard = KeyboardController()
-
-            if key_type == 'char':
-                # Regular character
-                keyboard.type(key_value)
-            elif key_type == 'special':
-                # Special keys
-                key_map = {
-                    'enter': Key.enter,
-                    'backspace': Key.backspace,
-                    'space': Key.space,
-                    'tab': Key.tab,
-                    'escape': Key.esc,
-                    'shift': Key.shift,
-                    'ctrl': Key.ctrl,
-                    'alt': Key.alt,
-                    'up': Key.up,
-                    'down': Key.down,
-                    'left': Key.left,
-                    'right': Key.right,
-                    'home': Key.home,
-                    'end': Key.end,
-                    'page_up': Key.page_up,
-                    'page_down': Key.page_down,
-                    'delete': Key.delete,
-                    'f1': Key.f1, 'f2': Key.f2, 'f3': Key.f3, 'f4': Key.f4,
-                    'f5': Key.f5, 'f6': Key.f6, 'f7': Key.f7, 'f8': Key.f8,
-                    'f9': Key.f9, 'f10': Key.f10, 'f11': Key.f11, 'f12': Key.f12
-                }
+    def move(self, dx, dy):
+        """Queue a relative cursor move"""
+        self._queue.put((None, (dx, dy)))
 
-                if key_value in key_map:
-                    keyboard.press(key_map[key_value])
-                    keyboard.release(key_map[key_value])
-            elif key_type == 'combo':
-                # Key combinations like Ctrl+C
-                keys = key_value.split('+')
-                key_objects = []
-
-                for key in keys:
-                    if key.lower() == 'ctrl':
-                        key_objects.append(Key.ctrl)
-                    elif key.lower() == 'shift':
-                        key_objects.append(Key.shift)
-                    elif key.lower() == 'alt':
-                        key_objects.append(Key.alt)
-                    else:
-                        key_objects.append(key.lower())
-
-                # Press all keys
-                for key in key_objects:
-                    keyboard.press(key)
-
-                # Release all keys in reverse order
-                for key in reversed(key_objects):
-                    keyboard.release(key)
+    def submit(self, func, *args):
+        """Queue a blocking input call such as a click or keypress"""
+        self._queue.put((func, args))
 
+    def run(self):
+        """Apply everything queued so far, then pause before the next move flush"""
+        while True:
+            item = self._queue.get()
+            dx = dy = 0
+            moved = False
+
+            while True:
+                if item is self._STOP:
+                    if dx or dy:
+                        self.apply(self.move_cursor, dx, dy)
+                    return
+
+                func, args = item
+                if func is None:
+                    try:
+                        dx, dy = dx + args[0], dy + args[1]
+                    except Exception as e:
+                        # A bad delta drops only that move, never the worker
+                        if self.log_callback:
+                            self.log_callback(f"Input error: {e}")
+                else:
+                    # Clicks and keys land where the cursor was headed when they were sent
+                    if dx or dy:
+                        self.apply(self.move_cursor, dx, dy)
+                        dx = dy = 0
+                        moved = True
+                    self.apply(func, *args)
+
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if dx or dy:
+                self.apply(self.move_cursor, dx, dy)
+                moved = True
+
+            # Let further moves pile up so the cursor is updated at a fixed rate
+            if moved:
+                time.sleep(self.interval)
+
+    def apply(self, func, *args):
+        """Run one input call, logging failures instead of killing the worker"""
+        try:
+            func(*args)
         except Exception as e:
-            self.log(f"Keyboard error: {e}")
+            if self.log_callback:
+                self.log_callback(f"Input error: {e}")
 
-    def zoom(self, direction):
-        """Simulate zoom using Ctrl + scroll wheel"""
-        if self.mouse_controller:
+    def stop(self):
+        """Finish queued input and stop the worker"""
+        self._queue.put(self._STOP)
+
+
+class MouseControlServer(socketserver.ThreadingTCPServer):
+    """TCP server that handles each phone connection on its own thread"""
+    daemon_threads = True
+    # Restart on the same port without waiting out TIME_WAIT. Windows already allows
+    # that, and there SO_REUSEADDR would let a second server bind the port in use.
+    allow_reuse_address = sys.platform != 'win32'
+    request_queue_size = 128
+    # One or two phones are normal; beyond this, refuse rather than spawn more threads
+    max_connections = 32
+
+    def __init__(self, server_address, handler_class):
+        self._connections = set()
+        self._connections_lock = threading.Lock()
+        super().__init__(server_address, handler_class)
+
+    def process_request(self, request, client_address):
+        with self._connections_lock:
+            accepted = len(self._connections) < self.max_connections
+            if accepted:
+                self._connections.add(request)
+        if not accepted:
+            log = self.RequestHandlerClass.log_callback
+            if log:
+                log(f"Refused connection from {client_address[0]}: too many open connections")
+            self.shutdown_request(request)
+            return
+        super().process_request(request, client_address)
+
+    def shutdown_request(self, request):
+        with self._connections_lock:
+            self._connections.discard(request)
+        super().shutdown_request(request)
+
+    def server_close(self):
+        """Close the listener and any kept-alive phone connections"""
+        super().server_close()
+        with self._connections_lock:
+            connections = list(self._connections)
+        for connection in connections:
             try:
-                from pynput.keyboard import Key, Controller as KeyboardController
-                keyboard = KeyboardController()
-
-                keyboard.press(Key.ctrl)
-                if direction == 'in':
-                    self.mouse_controller.scroll(0, 3)  # More scroll for zoom
-                else:  # zoom out
-                    self.mouse_controller.scroll(0, -3)
-                keyboard.release(Key.ctrl)
-            except Exception as e:
-                self.log(f"Zoom error: {e}")  # Log zoom errors for debugging
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
 
-    def log_message(self, format, *args):
-        """Override to suppress default logging"""
-        pass
 
-    def get_html_interface(self):
-        """Return the mobile-optimized HTML interface"""
-        return '''<!DOCTYPE html>
+# Mobile-optimized HTML interface, encoded once at import
+HTML_INTERFACE = '''<!DOCTYPE html>
     <html lang="en">
     <head>
         <meta charset="UTF-8">
@@ -568,6 +645,14 @@ class MouseControlHandler(http.server.BaseHTTPRequestHandler):
             let isZooming = false;
             let keyboardVisible = false;
 
+            // Persistent command socket; POST is used while it is not open
+            let ws = null;
+
+            // Deltas are batched per animation frame and throttled by measured round-trip time
+            let rtt = 0;
+            let pendingDx = 0, pendingDy = 0, lastMoveSend = 0, moveScheduled = false;
+            let pendingScroll = 0, lastScrollSend = 0, scrollScheduled = false;
+
             // Get DOM elements
             const gestureIndicator = document.getElementById('gestureIndicator');
             const status = document.getElementById('status');
@@ -581,21 +666,164 @@ class MouseControlHandler(http.server.BaseHTTPRequestHandler):
                 setTimeout(() => gestureIndicator.classList.remove('show'), 1000);
             }
 
+            function connectSocket() {
+                const socket = new WebSocket(`ws://${window.location.host}/ws`);
+                socket.binaryType = 'arraybuffer';
+                socket.onopen = () => { ws = socket; };
+                socket.onclose = () => {
+                    ws = null;
+                    setTimeout(connectSocket, 1000);
+                };
+            }
+
+            function socketBusy() {
+                return ws !== null && ws.bufferedAmount > 0;
+            }
+
             function sendCommand(command) {
+                if (ws && ws.readyState === WebSocket.OPEN) {
+                    ws.send(JSON.stringify(command));
+                    return;
+                }
+
+                const t0 = performance.now();
                 fetch(window.location.origin, {
                     method: 'POST',
                     headers: { 'Content-Type': 'application/json' },
                     body: JSON.stringify(command)
+                }).then(() => {
+                    const sample = performance.now() - t0;
+                    rtt = rtt ? 0.9 * rtt + 0.1 * sample : sample;
                 }).catch(error => console.error('Error:', error));
             }
 
+            function sendMove(dx, dy) {
+                if (ws && ws.readyState === WebSocket.OPEN) {
+                    if (dx >= -128 && dx <= 127 && dy >= -128 && dy <= 127) {
+                        // Typical per-frame deltas: 'm' + int8 dx + int8 dy
+                        ws.send(new Int8Array([0x6D, dx, dy]));
+                        return;
+                    }
+                    // Large swipes: 'M' + int16 dx + int16 dy, little-endian
+                    const frame = new DataView(new ArrayBuffer(5));
+                    frame.setUint8(0, 0x4D);
+                    frame.setInt16(1, dx, true);
+                    frame.setInt16(3, dy, true);
+                    ws.send(frame.buffer);
+                } else {
+                    sendCommand({ action: 'move', dx: dx, dy: dy });
+                }
+            }
+
+            const CLICK_BUTTONS = ['left', 'right', 'middle'];
+
+            function sendClickCommand(button) {
+                const index = CLICK_BUTTONS.indexOf(button);
+                if (ws && ws.readyState === WebSocket.OPEN && index >= 0) {
+                    // 'c' + button index
+                    ws.send(new Uint8Array([0x63, index]));
+                } else {
+                    sendCommand({ action: 'click', button: button });
+                }
+            }
+
+            // Positive steps scroll up, negative scroll down
+            function sendScrollCommand(steps) {
+                if (ws && ws.readyState === WebSocket.OPEN && steps >= -128 && steps <= 127) {
+                    // 's' + int8 steps
+                    ws.send(new Int8Array([0x73, steps]));
+                } else {
+                    sendCommand({
+                        action: 'scroll',
+                        direction: steps > 0 ? 'up' : 'down',
+                        amount: Math.abs(steps)
+                    });
+                }
+            }
+
+            function minSendInterval() {
+                return Math.min(100, Math.max(8, rtt * 1.2));
+            }
+
+            // Flush on an animation frame once the throttle interval since lastSend has passed
+            function scheduleFlush(flush, lastSend) {
+                const wait = lastSend + minSendInterval() - performance.now();
+                if (wait <= 0) {
+                    requestAnimationFrame(flush);
+                } else {
+                    setTimeout(() => requestAnimationFrame(flush), wait);
+                }
+            }
+
+            function queueMove(dx, dy) {
+                pendingDx += dx;
+                pendingDy += dy;
+                if (moveScheduled) return;
+                moveScheduled = true;
+                scheduleFlush(flushMove, lastMoveSend);
+            }
+
+            function sendPendingMove() {
+                // Send whole pixels; the fractional remainder carries over
+                const dx = Math.round(pendingDx);
+                const dy = Math.round(pendingDy);
+                if (!dx && !dy) return;
+                lastMoveSend = performance.now();
+                sendMove(dx, dy);
+                pendingDx -= dx;
+                pendingDy -= dy;
+            }
+
+            function flushMove() {
+                moveScheduled = false;
+                if (Math.abs(pendingDx) < 0.5 && Math.abs(pendingDy) < 0.5) return;
+                if (socketBusy()) {
+                    moveScheduled = true;
+                    scheduleFlush(flushMove, performance.now());
+                    return;
+                }
+                sendPendingMove();
+            }
+
+            function queueScroll(amount) {
+                pendingScroll += amount;
+                if (scrollScheduled) return;
+                scrollScheduled = true;
+                scheduleFlush(flushScroll, lastScrollSend);
+            }
+
+            function sendPendingScroll() {
+                if (!pendingScroll) return;
+                lastScrollSend = performance.now();
+                sendScrollCommand(pendingScroll);
+                pendingScroll = 0;
+            }
+
+            function flushScroll() {
+                scrollScheduled = false;
+                if (!pendingScroll) return;
+                if (socketBusy()) {
+                    scrollScheduled = true;
+                    scheduleFlush(flushScroll, performance.now());
+                    return;
+                }
+                sendPendingScroll();
+            }
+
+            // Send queued motion now, so a click that follows lands where the cursor ended up
+            function flushPendingInput() {
+                sendPendingMove();
+                sendPendingScroll();
+            }
+
             function sendClick(button) {
-                sendCommand({ action: 'click', button: button });
+                flushPendingInput();
+                sendClickCommand(button);
                 showGesture(button === 'left' ? '👆 Left Click' : '👆 Right Click');
             }
 
             function sendScroll(direction) {
-                sendCommand({ action: 'scroll', direction: direction, amount: 3 });
+                sendScrollCommand(direction === 'up' ? 3 : -3);
                 showGesture(direction === 'up' ? '⬆️ Scroll Up' : '⬇️ Scroll Down');
             }
 
@@ -633,6 +861,8 @@ class MouseControlHandler(http.server.BaseHTTPRequestHandler):
                 return Math.sqrt(dx * dx + dy * dy);
             }
 
+            connectSocket();
+
             // Set up keyboard event listeners
             document.querySelectorAll('.key, .special-key').forEach(key => {
                 key.addEventListener('click', function(e) {
@@ -673,11 +903,7 @@ class MouseControlHandler(http.server.BaseHTTPRequestHandler):
                     const deltaY = touches[0].clientY - lastTouchY;
 
                     if (Math.abs(deltaX) > 1 || Math.abs(deltaY) > 1) {
-                        sendCommand({
-                            action: 'move',
-                            dx: deltaX,
-                            dy: deltaY
-                        });
+                        queueMove(deltaX, deltaY);
 
                         lastTouchX = touches[0].clientX;
                         lastTouchY = touches[0].clientY;
@@ -706,11 +932,7 @@ class MouseControlHandler(http.server.BaseHTTPRequestHandler):
                         if (Math.abs(deltaY) > 8) {
                             const direction = deltaY < 0 ? 'up' : 'down';
                             const amount = Math.ceil(Math.abs(deltaY) / 15);
-                            sendCommand({
-                                action: 'scroll',
-                                direction: direction,
-                                amount: amount
-                            });
+                            queueScroll(direction === 'up' ? amount : -amount);
                             lastTouchY = centerY;
                             showGesture(direction === 'up' ? '⬆️ Scroll' : '⬇️ Scroll');
                         }
@@ -720,6 +942,7 @@ class MouseControlHandler(http.server.BaseHTTPRequestHandler):
 
             trackpad.addEventListener('touchend', function(e) {
                 e.preventDefault();
+                flushPendingInput();
                 const touchDuration = Date.now() - lastTouchTime;
 
                 if (touchDuration < 200 && e.changedTouches.length === 1 && e.touches.length === 0) {
@@ -727,8 +950,7 @@ class MouseControlHandler(http.server.BaseHTTPRequestHandler):
                                      Math.abs(e.changedTouches[0].clientY - lastTouchY) > 10;
 
                     if (!wasMoving && !isScrolling && !isZooming) {
-                        sendCommand({ action: 'click', button: 'left' });
-                        showGesture('👆 Left Click');
+                        sendClick('left');
                     }
                 }
 
@@ -744,35 +966,530 @@ class MouseControlHandler(http.server.BaseHTTPRequestHandler):
             document.addEventListener('gesturechange', e => e.preventDefault());
             document.addEventListener('gestureend', e => e.preventDefault());
 
-            // Update status periodically
-            setInterval(() => {
+            // Update status periodically, but only while the page is visible
+            let statusTimer = null;
+
+            function updateStatus() {
                 status.textContent = `Connected • ${new Date().toLocaleTimeString()} • ${keyboardVisible ? 'Keyboard Active' : 'Ready'}`;
-            }, 5000);
+            }
+
+            function startStatusTimer() {
+                if (statusTimer === null) {
+                    statusTimer = setInterval(updateStatus, 5000);
+                }
+            }
+
+            function stopStatusTimer() {
+                clearInterval(statusTimer);
+                statusTimer = null;
+            }
+
+            document.addEventListener('visibilitychange', function() {
+                if (document.hidden) {
+                    stopStatusTimer();
+                } else {
+                    updateStatus();
+                    startStatusTimer();
+                }
+            });
+            startStatusTimer();
         </script>
     </body>
     </html>'''
+HTML_BYTES = HTML_INTERFACE.encode('utf-8')
+HTML_GZIP = gzip.compress(HTML_BYTES, 9)
+
+# The page is served from prebuilt status line + headers + body, one per encoding
+HTML_RESPONSE_HEAD = (b'HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\n'
+                      b'Content-Length: %d\r\n%sVary: Accept-Encoding\r\n'
+                      b'Cache-Control: public, max-age=3600\r\n\r\n')
+HTML_HTTP_RESPONSE = HTML_RESPONSE_HEAD % (len(HTML_BYTES), b'') + HTML_BYTES
+HTML_GZIP_HTTP_RESPONSE = (HTML_RESPONSE_HEAD % (len(HTML_GZIP), b'Content-Encoding: gzip\r\n')
+                           + HTML_GZIP)
+
+# Command replies are built from one status line + headers template; the
+# reply to every successful command is serialized once in full
+JSON_RESPONSE_HEAD = b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n'
+OK_RESPONSE = b'{"status":"ok"}'
+OK_HTTP_RESPONSE = JSON_RESPONSE_HEAD % len(OK_RESPONSE) + OK_RESPONSE
+MAX_COMMAND_LENGTH = 256
+
+# WebSocket handshake constant and frame opcodes (RFC 6455)
+WEBSOCKET_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+WS_TEXT = 0x1
+WS_BINARY = 0x2
+WS_CLOSE = 0x8
+WS_PING = 0x9
+WS_PONG = 0xA
+WS_MAX_PAYLOAD = 4096
+WS_MAX_CONTROL_PAYLOAD = 125
+
+DEFAULT_PORT = 3000
+
+# Wheel direction for scroll commands; anything but 'up' scrolls down
+SCROLL_SIGNS = {'up': 1, 'down': -1}
+
+# Binary WebSocket frames, one opcode byte then little-endian fields:
+#   b'M' int16 dx, int16 dy  |  b'm' int8 dx, int8 dy (the common small deltas)
+#   b'c' uint8 button index  |  b's' int8 wheel steps (positive scrolls up)
+MOVE_OPCODE = 0x4D
+SMALL_MOVE_OPCODE = 0x6D
+CLICK_OPCODE = 0x63
+SCROLL_OPCODE = 0x73
+
+# Precompiled layouts for the binary frames; the pad byte skips the opcode
+BINARY_FRAMES = {
+    MOVE_OPCODE: struct.Struct('<xhh'),
+    SMALL_MOVE_OPCODE: struct.Struct('<xbb'),
+    CLICK_OPCODE: struct.Struct('<xB'),
+    SCROLL_OPCODE: struct.Struct('<xb'),
+}
+
+# Button index in a binary click frame -> button name
+CLICK_BUTTON_NAMES = ('left', 'right', 'middle')
+WS_LENGTH16 = struct.Struct('!H')
+WS_LENGTH64 = struct.Struct('!Q')
+
+# TCP keepalive probing (seconds), so a phone that drops off Wi-Fi frees its connection
+KEEPALIVE_IDLE = 30
+KEEPALIVE_INTERVAL = 10
+KEEPALIVE_COUNT = 3
+
+
+class MouseControlHandler(http.server.BaseHTTPRequestHandler):
+    """HTTP request handler for mouse control commands"""
+    # Keep connections open so the phone reuses one socket for many commands
+    protocol_version = 'HTTP/1.1'
+
+    mouse_controller = None
+    keyboard_controller = None
+    input_worker = None
+
+    # Controller methods bound once by the setters, so each command skips the lookup
+    mouse_click = None
+    mouse_scroll = None
+    key_press = None
+    key_release = None
+    type_text = None
+    log_callback = None
+
+    # Per-command log lines; connection and error messages are always logged
+    log_commands = True
+
+    # 'keys' sends Ctrl+= / Ctrl+-; 'wheel' emulates Ctrl + scroll wheel for apps without the shortcut
+    zoom_mode = 'keys'
+
+    @classmethod
+    def set_mouse_controller(cls, controller):
+        cls.mouse_controller = controller
+        cls.mouse_click = controller.click if controller else None
+        cls.mouse_scroll = controller.scroll if controller else None
+
+    @classmethod
+    def set_keyboard_controller(cls, controller):
+        cls.keyboard_controller = controller
+        cls.key_press = controller.press if controller else None
+        cls.key_release = controller.release if controller else None
+        cls.type_text = controller.type if controller else None
+
+    @classmethod
+    def set_input_worker(cls, worker):
+        cls.input_worker = worker
+
+    @classmethod
+    def set_log_callback(cls, callback):
+        cls.log_callback = callback
+
+    @classmethod
+    def set_log_commands(cls, enabled):
+        cls.log_commands = enabled
+
+    def log(self, message):
+        if self.log_callback:
+            self.log_callback(message)
+
+    def setup(self):
+        super().setup()
+        # Small replies and WebSocket frames go out immediately instead of waiting on Nagle
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.enable_keepalive()
+
+    def enable_keepalive(self):
+        """Probe idle connections so dead peers are closed instead of holding a slot"""
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, 'SIO_KEEPALIVE_VALS'):
+            self.connection.ioctl(socket.SIO_KEEPALIVE_VALS,
+                                  (1, KEEPALIVE_IDLE * 1000, KEEPALIVE_INTERVAL * 1000))
+            return
+        for option, value in (('TCP_KEEPIDLE', KEEPALIVE_IDLE),
+                              ('TCP_KEEPINTVL', KEEPALIVE_INTERVAL),
+                              ('TCP_KEEPCNT', KEEPALIVE_COUNT)):
+            if hasattr(socket, option):
+                self.connection.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+
+    def do_GET(self):
+        """Serve the HTML interface"""
+        if self.path == '/ws':
+            self.handle_websocket()
+        elif self.path == '/' or self.path == '/index.html':
+            if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                response = HTML_GZIP_HTTP_RESPONSE
+            else:
+                response = HTML_HTTP_RESPONSE
+            # Status line, headers and body leave in a single write
+            self.wfile.write(response)
+            self.log(f"Served interface to {self.client_address[0]}")
+        else:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+    def do_POST(self):
+        """Handle mouse control commands"""
+        # A JSON content type forces a CORS preflight, which other sites' pages cannot pass
+        content_type = self.headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+        if content_type != 'application/json':
+            self.send_error(415, "Expected application/json")
+            return
+
+        # Commands are a few dozen bytes; refuse anything else before reading it
+        try:
+            content_length = int(self.headers.get('Content-Length', ''))
+        except ValueError:
+            content_length = 0
+        if content_length <= 0:
+            self.send_error(400, "Expected a JSON command body")
+            return
+        if content_length > MAX_COMMAND_LENGTH:
+            self.send_error(413, "Command too large")
+            return
+
+        try:
+            post_data = self.rfile.read(content_length)
+            self.handle_command(json_loads(post_data))
+            response = OK_HTTP_RESPONSE
+
+        except Exception as e:
+            self.log(f"Error handling command: {e}")
+            body = json_dumps({'status': 'error', 'message': str(e)})
+            response = JSON_RESPONSE_HEAD % len(body) + body
+
+        # Status line, headers and body leave in a single write
+        self.wfile.write(response)
+
+    def handle_command(self, command):
+        """Dispatch a decoded command from the phone"""
+        handler = self.COMMAND_HANDLERS.get(command.get('action'))
+        if handler:
+            handler(self, command)
+
+    def handle_move(self, command):
+        """Queue a scaled trackpad move"""
+        dx = command.get('dx', 0)
+        dy = command.get('dy', 0)
+        # Reject strings and bools here, where the error reaches the phone
+        if type(dx) not in (int, float) or type(dy) not in (int, float):
+            raise TypeError("dx and dy must be numbers")
+        # Scale the movement for better control
+        self.move_mouse(dx * 2, dy * 2)
+
+    def handle_click(self, command):
+        """Click a mouse button"""
+        self.queue_click(command.get('button', 'left'))
+
+    def queue_click(self, button):
+        """Hand a click to the input worker"""
+        self.run_input(self.click, button)
+        if self.log_commands:
+            self.log(f"Click: {button} from {self.client_address[0]}")
+
+    def handle_scroll(self, command):
+        """Scroll the mouse wheel"""
+        self.queue_scroll(command.get('direction', 'up'), command.get('amount', 1))
+
+    def queue_scroll(self, direction, amount):
+        """Hand a scroll to the input worker"""
+        self.run_input(self.scroll, direction, amount)
+        if self.log_commands:
+            self.log(f"Scroll: {direction} (x{amount}) from {self.client_address[0]}")
+
+    def handle_key(self, command):
+        """Send a key, special key or key combination"""
+        key_type = command.get('key_type', 'char')
+        key_value = command.get('key_value', '')
+        self.run_input(self.send_key, key_type, key_value)
+        if self.log_commands:
+            self.log(f"Key: {key_type}={key_value} from {self.client_address[0]}")
+
+    def handle_zoom(self, command):
+        """Zoom in or out"""
+        direction = command.get('direction', 'in')
+        self.run_input(self.zoom, direction)
+        if self.log_commands:
+            self.log(f"Zoom: {direction} from {self.client_address[0]}")
+
+    # Command action -> handler, looked up once per command
+    COMMAND_HANDLERS = {
+        'move': handle_move,
+        'click': handle_click,
+        'scroll': handle_scroll,
+        'key': handle_key,
+        'zoom': handle_zoom,
+    }
+
+    def handle_websocket(self):
+        """Upgrade to a WebSocket and handle one command per text frame"""
+        key = self.headers.get('Sec-WebSocket-Key')
+        if not key or self.headers.get('Upgrade', '').lower() != 'websocket':
+            self.send_error(400, "Expected a WebSocket upgrade")
+            return
+
+        # Browsers always send Origin, so only the control page itself may connect
+        origin = self.headers.get('Origin')
+        if origin is not None and origin != f"http://{self.headers.get('Host', '')}":
+            self.log(f"Refused WebSocket from {self.client_address[0]}: origin {origin}")
+            self.send_error(403, "Cross-origin WebSocket refused")
+            return
+
+        accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode('ascii')).digest())
+        self.send_response(101, 'Switching Protocols')
+        self.send_header('Upgrade', 'websocket')
+        self.send_header('Connection', 'Upgrade')
+        self.send_header('Sec-WebSocket-Accept', accept.decode('ascii'))
+        self.end_headers()
+        self.close_connection = True
+        self.log(f"WebSocket connected from {self.client_address[0]}")
+
+        try:
+            while True:
+                frame = self.read_websocket_frame()
+                if frame is None:
+                    break
+                opcode, payload = frame
+
+                if opcode == WS_BINARY:
+                    self.handle_binary_command(payload)
+                elif opcode == WS_TEXT:
+                    try:
+                        self.handle_command(json_loads(payload))
+                    except Exception as e:
+                        self.log(f"Error handling command: {e}")
+                elif opcode == WS_PING:
+                    self.send_websocket_frame(WS_PONG, payload)
+                elif opcode == WS_CLOSE:
+                    self.send_websocket_frame(WS_CLOSE, payload[:2])
+                    break
+        except OSError:
+            pass
+
+        self.log(f"WebSocket closed from {self.client_address[0]}")
+
+    def handle_binary_command(self, payload):
+        """Dispatch a packed binary move, click or scroll frame"""
+        layout = BINARY_FRAMES.get(payload[0]) if payload else None
+        if layout is None or len(payload) != layout.size:
+            return
+        self.BINARY_HANDLERS[payload[0]](self, *layout.unpack(payload))
+
+    def binary_move(self, dx, dy):
+        """Queue a scaled move from a binary frame"""
+        # Scale the movement for better control
+        self.move_mouse(dx * 2, dy * 2)
+
+    def binary_click(self, button_index):
+        """Click the button named by a binary frame's button index"""
+        if button_index < len(CLICK_BUTTON_NAMES):
+            self.queue_click(CLICK_BUTTON_NAMES[button_index])
+
+    def binary_scroll(self, steps):
+        """Scroll by the signed wheel steps in a binary frame"""
+        if steps:
+            self.queue_scroll('up' if steps > 0 else 'down', abs(steps))
+
+    # Binary frame opcode -> handler
+    BINARY_HANDLERS = {
+        MOVE_OPCODE: binary_move,
+        SMALL_MOVE_OPCODE: binary_move,
+        CLICK_OPCODE: binary_click,
+        SCROLL_OPCODE: binary_scroll,
+    }
+
+    def read_websocket_frame(self):
+        """Read one client frame, returning (opcode, payload) or None when the socket is done"""
+        header = self.rfile.read(2)
+        if len(header) < 2:
+            return None
+
+        # Commands are tiny, so fragmented messages are never expected
+        if not header[0] & 0x80:
+            return None
+        opcode = header[0] & 0x0F
+
+        length = header[1] & 0x7F
+        if length >= 126:
+            length_struct = WS_LENGTH16 if length == 126 else WS_LENGTH64
+            extended = self.rfile.read(length_struct.size)
+            if len(extended) < length_struct.size:
+                return None
+            length = length_struct.unpack(extended)[0]
+        if length > WS_MAX_PAYLOAD:
+            return None
+        # RFC 6455 5.5: control frames carry at most 125 bytes
+        if opcode >= WS_CLOSE and length > WS_MAX_CONTROL_PAYLOAD:
+            return None
+
+        mask = self.rfile.read(4) if header[1] & 0x80 else b''
+        payload = self.rfile.read(length)
+        if len(payload) < length:
+            return None
+
+        if mask:
+            key = (mask * (length // 4 + 1))[:length]
+            payload = (int.from_bytes(payload, 'big') ^ int.from_bytes(key, 'big')).to_bytes(length, 'big')
+
+        return opcode, payload
+
+    def send_websocket_frame(self, opcode, payload=b''):
+        """Send a single unmasked control frame"""
+        try:
+            self.wfile.write(bytes((0x80 | opcode, len(payload))) + payload)
+        except OSError:
+            pass
+
+    def run_input(self, func, *args):
+        """Hand a blocking pynput call to the input worker and return immediately"""
+        # Read once: stopping the server clears the shared worker while handlers still run
+        worker = self.input_worker
+        if worker:
+            worker.submit(func, *args)
+        else:
+            func(*args)
+
+    def move_mouse(self, dx, dy):
+        """Queue a move relative to current position"""
+        worker = self.input_worker
+        if worker:
+            worker.move(dx, dy)
+
+    def click(self, button='left'):
+        """Perform mouse click"""
+        if self.mouse_controller:
+            try:
+                mouse_button = MOUSE_BUTTONS.get(button)
+                if mouse_button is not None:
+                    self.mouse_click(mouse_button)
+            except Exception as e:
+                self.log(f"Mouse click error: {e}")
+
+    def scroll(self, direction, amount=1):
+        """Scroll mouse wheel"""
+        if self.mouse_controller:
+            try:
+                self.mouse_scroll(0, amount * SCROLL_SIGNS.get(direction, -1))
+            except Exception as e:
+                self.log(f"Mouse scroll error: {e}")
+
+    def send_key(self, key_type, key_value):
+        """Send keyboard input"""
+        if self.keyboard_controller:
+            press, release = self.key_press, self.key_release
+            try:
+                if key_type == 'char':
+                    # Regular character
+                    self.type_text(key_value)
+                elif key_type == 'special':
+                    # Special keys
+                    key = KEY_MAP.get(key_value)
+                    if key:
+                        press(key)
+                        release(key)
+                elif key_type == 'combo':
+                    # Key combinations like Ctrl+C
+                    key_objects = parse_combo(key_value)
+
+                    # Press all keys
+                    for key in key_objects:
+                        press(key)
+
+                    # Release all keys in reverse order
+                    for key in reversed(key_objects):
+                        release(key)
+
+            except Exception as e:
+                self.log(f"Keyboard error: {e}")
+
+    def zoom(self, direction):
+        """Zoom with the Ctrl+= / Ctrl+- shortcut, or Ctrl + scroll wheel in 'wheel' mode"""
+        if self.mouse_controller and self.keyboard_controller:
+            press, release = self.key_press, self.key_release
+            try:
+                press(Key.ctrl)
+                if self.zoom_mode == 'wheel':
+                    if direction == 'in':
+                        self.mouse_scroll(0, 3)  # More scroll for zoom
+                    else:  # zoom out
+                        self.mouse_scroll(0, -3)
+                else:
+                    key = '=' if direction == 'in' else '-'
+                    press(key)
+                    release(key)
+                release(Key.ctrl)
+            except Exception as e:
+                self.log(f"Zoom error: {e}")  # Log zoom errors for debugging
+
+    def log_message(self, format, *args):
+        """Override to suppress default logging"""
+        pass
 
 
 class ServerThread(QThread):
     """Thread to run the HTTP server"""
-    log_signal = pyqtSignal(str)
+    log_pending_signal = pyqtSignal()  # log_queue went from drained to non-empty
     status_signal = pyqtSignal(str, str)  # status, ip
 
-    def __init__(self, port=3000):
+    def __init__(self, port=DEFAULT_PORT):
         super().__init__()
         self.port = port
         self.httpd = None
+        self.input_worker = None
         self.running = False
+        self.local_ip = None
 
-        if PYNPUT_AVAILABLE:
-            MouseControlHandler.set_mouse_controller(mouse.Controller())
-        MouseControlHandler.set_log_callback(self.emit_log)
+        # All server log lines, collected by the GUI in batches
+        self.log_queue = collections.deque(maxlen=1000)
+        self.log_pending = False
 
-    def emit_log(self, message):
-        self.log_signal.emit(message)
+        if PYNPUT_AVAILABLE:
+            load_pynput()
+            MouseControlHandler.set_mouse_controller(create_mouse_backend(mouse.Controller()))
+            MouseControlHandler.set_keyboard_controller(KeyboardController())
+        MouseControlHandler.set_log_callback(self.queue_log)
+
+    def queue_log(self, message):
+        """Record a log line, notifying the GUI only once per drained batch"""
+        self.log_queue.append((time.time(), message))
+        if not self.log_pending:
+            self.log_pending = True
+            self.log_pending_signal.emit()
 
     def get_local_ip(self):
-        """Get the local IP address"""
+        """Get the local IP address, probing only if none is cached yet"""
+        if self.local_ip is None:
+            self.local_ip = self.probe_local_ip()
+        return self.local_ip
+
+    def refresh_ip(self):
+        """Re-probe the local IP and report it if the network changed"""
+        ip = self.probe_local_ip()
+        if ip != self.local_ip:
+            self.local_ip = ip
+            if self.running:
+                self.queue_log(f"📱 Phone URL: http://{ip}:{self.port}")
+                self.status_signal.emit("running", ip)
+
+    @staticmethod
+    def probe_local_ip():
+        """Find the address of the interface that routes outwards"""
         try:
             s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             s.connect(("8.8.8.8", 80))
@@ -785,20 +1502,30 @@ class ServerThread(QThread):
     def run(self):
         """Start the HTTP server"""
         try:
-            self.httpd = socketserver.TCPServer(("0.0.0.0", self.port), MouseControlHandler)
+            self.httpd = MouseControlServer(("0.0.0.0", self.port), MouseControlHandler)
             self.running = True
 
+            # A single worker keeps moves, clicks and keystrokes in the order they arrived
+            if MouseControlHandler.mouse_controller:
+                self.input_worker = InputWorker(MouseControlHandler.mouse_controller.move, self.queue_log)
+                self.input_worker.start()
+            MouseControlHandler.set_input_worker(self.input_worker)
+
             local_ip = self.get_local_ip()
-            self.emit_log(f"🚀 Server started on port {self.port}")
-            self.emit_log(f"📱 Phone URL: http://{local_ip}:{self.port}")
-            self.emit_log(f"💻 Local URL: http://localhost:{self.port}")
+            self.queue_log(f"🚀 Server started on port {self.port}")
+            self.queue_log(f"📱 Phone URL: http://{local_ip}:{self.port}")
+            self.queue_log(f"💻 Local URL: http://localhost:{self.port}")
             self.status_signal.emit("running", local_ip)
 
             self.httpd.serve_forever()
         except Exception as e:
-            self.emit_log(f"❌ Server error: {e}")
+            self.queue_log(f"❌ Server error: {e}")
             self.status_signal.emit("error", "")
         finally:
+            if self.input_worker:
+                self.input_worker.stop()
+                self.input_worker = None
+            MouseControlHandler.set_input_worker(None)
             self.running = False
             self.status_signal.emit("stopped", "")
 
@@ -808,11 +1535,12 @@ class ServerThread(QThread):
             self.httpd.shutdown()
             self.httpd.server_close()
         self.running = False
-        self.emit_log("🛑 Server stopped")
+        self.queue_log("🛑 Server stopped")
 
 
+@functools.lru_cache(maxsize=8)
 def create_icon(color, size=64):
-    """Create a simple colored icon"""
+    """Create a simple colored icon, shared by every caller asking for the same one"""
     pixmap = QPixmap(size, size)
     pixmap.fill(Qt.GlobalColor.transparent)
 
@@ -826,6 +1554,160 @@ def create_icon(color, size=64):
     return QIcon(pixmap)
 
 
+HELP_SECTIONS = (
+    ("🚀 Quick Start", """
+<b>1. Start the Server:</b> Click the "Start Server" button in the Control tab<br>
+<b>2. Connect Your Phone:</b> Open the displayed URL in your phone's web browser<br>
+<b>3. Control Mouse:</b> Use the trackpad area to move the cursor, tap buttons to click
+    """),
+
+    ("📱 Phone Setup", """
+<b>Same WiFi Network:</b> Ensure both devices are connected to the same WiFi network<br>
+<b>Disable Mobile Data:</b> Turn off mobile data to force WiFi usage<br>
+<b>Try Different Browsers:</b> Chrome, Safari, Firefox all work<br>
+<b>Bookmark the URL:</b> Save the connection URL for quick access
+    """),
+
+    ("🔧 Troubleshooting", """
+<b>Can't Connect from Phone:</b><br>
+• Check if both devices are on the same WiFi network (not guest network)<br>
+• Disable Windows Firewall temporarily to test<br>
+• Make sure the server is running (green status)<br>
+• Try accessing http://localhost:3000 on this computer first<br><br>
+
+<b>Windows Firewall Issues:</b><br>
+• Press Win+R, type "firewall.cpl"<br>
+• Click "Allow an app or feature through Windows Defender Firewall"<br>
+• Add Python to the allowed apps list<br>
+• Or temporarily disable Private network firewall<br><br>
+
+<b>Network Profile Issues:</b><br>
+• Go to Settings → Network & Internet → WiFi<br>
+• Click your network name<br>
+• Set Network profile to "Private"<br><br>
+
+<b>Router Issues:</b><br>
+• Some routers have "AP Isolation" or "Client Isolation" enabled<br>
+• Log into your router and disable this feature<br>
+• Make sure you're not on a guest network
+    """),
+
+    ("🛡️ Firewall Configuration", """
+<b>Windows Defender Firewall:</b><br>
+1. Press Win+R, type "wf.msc", press Enter<br>
+2. Click "Inbound Rules" → "New Rule"<br>
+3. Choose "Port" → "TCP" → "Specific local ports" → "3000"<br>
+4. Choose "Allow the connection"<br>
+5. Apply to all profiles (Domain, Private, Public)<br>
+6. Name it "Mouse Controller"<br><br>
+
+<b>Alternative - Allow Python:</b><br>
+1. Press Win+R, type "firewall.cpl"<br>
+2. Click "Allow an app or feature through Windows Defender Firewall"<br>
+3. Click "Change Settings" → "Allow another app"<br>
+4. Browse to python.exe (usually in AppData\\Local\\Programs\\Python)<br>
+5. Check both "Private" and "Public" networks
+    """),
+
+    ("🌐 Network Diagnostics", """
+<b>Check Your IP Address:</b><br>
+• Open Command Prompt (cmd)<br>
+• Type: ipconfig<br>
+• Look for "Wireless LAN adapter Wi-Fi" section<br>
+• Use the IPv4 Address shown<br><br>
+
+<b>Test Server Locally:</b><br>
+• Open http://localhost:3000 in your browser<br>
+• If this doesn't work, the server has an issue<br>
+• If it works, the problem is network/firewall related<br><br>
+
+<b>Test from Another Computer:</b><br>
+• Try connecting from another device on the same network<br>
+• This helps isolate phone-specific issues
+    """),
+
+    ("📋 Requirements", """
+<b>Software Requirements:</b><br>
+• Python 3.6 or higher<br>
+• PyQt6: pip install PyQt6<br>
+• pynput: pip install pynput<br><br>
+
+<b>Network Requirements:</b><br>
+• WiFi network (both devices connected)<br>
+• Windows network profile set to "Private"<br>
+• Firewall configured to allow connections<br><br>
+
+<b>Supported Devices:</b><br>
+• Any device with a web browser<br>
+• iOS Safari, Android Chrome, Desktop browsers<br>
+• Works on tablets and phones
+    """),
+
+    ("⚙️ Advanced Settings", """
+<b>Change Port:</b><br>
+• Default port is 3000<br>
+• If blocked, try 8080, 8000, or 5000<br>
+• Edit the source code to change port<br><br>
+
+<b>Security Notes:</b><br>
+• Server allows anyone on your network to control your mouse<br>
+• Only run on trusted networks<br>
+• Stop the server when not in use<br><br>
+
+<b>Performance Tips:</b><br>
+• Close unnecessary applications for better responsiveness<br>
+• Use 5GHz WiFi if available (faster than 2.4GHz)<br>
+• Keep phone close to router for better signal
+    """)
+)
+
+# Server status -> (status label, status label style, IP label, status bar message)
+SERVER_STATUS_DISPLAY = {
+    "running": ("Server Status: Running ✅", "color: #27ae60; padding: 10px;",
+                "📱 Phone URL: http://{ip}:{port}", "Server running on {ip}:{port}"),
+    "error": ("Server Status: Error ❌", "color: #e74c3c; padding: 10px;",
+              "IP Address: Error occurred", "Server error occurred"),
+    "stopped": ("Server Status: Stopped", "color: #e74c3c; padding: 10px;",
+                "IP Address: Not available", "Server stopped"),
+}
+
+LOG_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+LOG_MAX_LINES = 2000
+
+HELP_HTML = "".join(
+    f"<h3>{title}</h3><p style='line-height: 140%;'>{content}</p>" for title, content in HELP_SECTIONS
+)
+
+# Start/stop buttons share one stylesheet and pick their colours by the 'role' property
+SERVER_BUTTON_STYLE = """
+    QPushButton {
+        color: white;
+        border: none;
+        padding: 12px 24px;
+        border-radius: 8px;
+        font-size: 14px;
+    }
+    QPushButton[role="start"] {
+        background-color: #27ae60;
+    }
+    QPushButton[role="start"]:hover {
+        background-color: #2ecc71;
+    }
+    QPushButton[role="start"]:pressed {
+        background-color: #229954;
+    }
+    QPushButton[role="stop"] {
+        background-color: #e74c3c;
+    }
+    QPushButton[role="stop"]:hover {
+        background-color: #c0392b;
+    }
+    QPushButton[role="stop"]:pressed {
+        background-color: #a93226;
+    }
+"""
+
+
 class MouseControllerGUI(QMainWindow):
     """Main GUI application window"""
 
@@ -835,9 +1717,21 @@ class MouseControllerGUI(QMainWindow):
         self.server_running = False
         self.current_ip = ""
 
+        # Pick up a new address if the laptop switches networks while running
+        self.ip_refresh_timer = QTimer(self)
+        self.ip_refresh_timer.setInterval(30000)
+        self.ip_refresh_timer.timeout.connect(self.refresh_server_ip)
+
         self.init_ui()
         self.init_system_tray()
 
+        # Leading + trailing throttle for draining server log lines
+        self.log_drain_requested = False
+        self.log_throttle = QTimer(self)
+        self.log_throttle.setSingleShot(True)
+        self.log_throttle.setInterval(50)
+        self.log_throttle.timeout.connect(self.log_throttle_elapsed)
+
         # Check dependencies
         if not PYNPUT_AVAILABLE:
             self.log("⚠️ Warning: pynput not installed. Mouse control will not work.")
@@ -857,6 +1751,10 @@ class MouseControllerGUI(QMainWindow):
         self.setCentralWidget(central_widget)
         layout = QVBoxLayout(central_widget)
 
+        # Fonts shared by the widgets below
+        self.heading_font = QFont("Arial", 12, QFont.Weight.Bold)
+        self.button_font = QFont("Arial", 11, QFont.Weight.Bold)
+
         # Create tab widget
         self.tabs = QTabWidget()
         layout.addWidget(self.tabs)
@@ -884,7 +1782,7 @@ class MouseControllerGUI(QMainWindow):
 
         # Status display
         self.status_label = QLabel("Server Status: Stopped")
-        self.status_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        self.status_label.setFont(self.heading_font)
         self.status_label.setStyleSheet("color: #e74c3c; padding: 10px;")
         header_layout.addWidget(self.status_label)
 
@@ -900,43 +1798,15 @@ class MouseControllerGUI(QMainWindow):
         controls_layout = QHBoxLayout(controls)
 
         self.start_btn = QPushButton("🚀 Start Server")
-        self.start_btn.setFont(QFont("Arial", 11, QFont.Weight.Bold))
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                padding: 12px 24px;
-                border-radius: 8px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #2ecc71;
-            }
-            QPushButton:pressed {
-                background-color: #229954;
-            }
-        """)
+        self.start_btn.setProperty("role", "start")
+        self.start_btn.setFont(self.button_font)
+        self.start_btn.setStyleSheet(SERVER_BUTTON_STYLE)
         self.start_btn.clicked.connect(self.start_server)
 
         self.stop_btn = QPushButton("🛑 Stop Server")
-        self.stop_btn.setFont(QFont("Arial", 11, QFont.Weight.Bold))
-        self.stop_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                padding: 12px 24px;
-                border-radius: 8px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:pressed {
-                background-color: #a93226;
-            }
-        """)
+        self.stop_btn.setProperty("role", "stop")
+        self.stop_btn.setFont(self.button_font)
+        self.stop_btn.setStyleSheet(SERVER_BUTTON_STYLE)
         self.stop_btn.clicked.connect(self.stop_server)
         self.stop_btn.setEnabled(False)
 
@@ -974,9 +1844,14 @@ class MouseControllerGUI(QMainWindow):
         # Logs header
         header_layout = QHBoxLayout()
         logs_label = QLabel("📋 Server Logs")
-        logs_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        logs_label.setFont(self.heading_font)
         header_layout.addWidget(logs_label)
 
+        log_commands_box = QCheckBox("Log every command")
+        log_commands_box.setChecked(MouseControlHandler.log_commands)
+        log_commands_box.toggled.connect(MouseControlHandler.set_log_commands)
+        header_layout.addWidget(log_commands_box)
+
         clear_btn = QPushButton("🗑️ Clear Logs")
         clear_btn.clicked.connect(self.clear_logs)
         clear_btn.setMaximumWidth(120)
@@ -997,151 +1872,38 @@ class MouseControllerGUI(QMainWindow):
             }
         """)
         self.logs_text.setReadOnly(True)
+        # Drop the oldest lines instead of growing without bound while the server runs
+        self.logs_text.document().setMaximumBlockCount(LOG_MAX_LINES)
         layout.addWidget(self.logs_text)
 
         self.tabs.addTab(logs_widget, "📋 Logs")
 
     def create_help_tab(self):
-        """Create the help tab"""
-        help_widget = QWidget()
-        layout = QVBoxLayout(help_widget)
-
-        # Create scrollable area
-        scroll = QScrollArea()
-        scroll_content = QWidget()
-        scroll_layout = QVBoxLayout(scroll_content)
-
-        help_sections = [
-            ("🚀 Quick Start", """
-<b>1. Start the Server:</b> Click the "Start Server" button in the Control tab<br>
-<b>2. Connect Your Phone:</b> Open the displayed URL in your phone's web browser<br>
-<b>3. Control Mouse:</b> Use the trackpad area to move the cursor, tap buttons to click
-            """),
-
-            ("📱 Phone Setup", """
-<b>Same WiFi Network:</b> Ensure both devices are connected to the same WiFi network<br>
-<b>Disable Mobile Data:</b> Turn off mobile data to force WiFi usage<br>
-<b>Try Different Browsers:</b> Chrome, Safari, Firefox all work<br>
-<b>Bookmark the URL:</b> Save the connection URL for quick access
-            """),
-
-            ("🔧 Troubleshooting", """
-<b>Can't Connect from Phone:</b><br>
-• Check if both devices are on the same WiFi network (not guest network)<br>
-• Disable Windows Firewall temporarily to test<br>
-• Make sure the server is running (green status)<br>
-• Try accessing http://localhost:3000 on this computer first<br><br>
-
-<b>Windows Firewall Issues:</b><br>
-• Press Win+R, type "firewall.cpl"<br>
-• Click "Allow an app or feature through Windows Defender Firewall"<br>
-• Add Python to the allowed apps list<br>
-• Or temporarily disable Private network firewall<br><br>
-
-<b>Network Profile Issues:</b><br>
-• Go to Settings → Network & Internet → WiFi<br>
-• Click your network name<br>
-• Set Network profile to "Private"<br><br>
-
-<b>Router Issues:</b><br>
-• Some routers have "AP Isolation" or "Client Isolation" enabled<br>
-• Log into your router and disable this feature<br>
-• Make sure you're not on a guest network
-            """),
-
-            ("🛡️ Firewall Configuration", """
-<b>Windows Defender Firewall:</b><br>
-1. Press Win+R, type "wf.msc", press Enter<br>
-2. Click "Inbound Rules" → "New Rule"<br>
-3. Choose "Port" → "TCP" → "Specific local ports" → "3000"<br>
-4. Choose "Allow the connection"<br>
-5. Apply to all profiles (Domain, Private, Public)<br>
-6. Name it "Mouse Controller"<br><br>
-
-<b>Alternative - Allow Python:</b><br>
-1. Press Win+R, type "firewall.cpl"<br>
-2. Click "Allow an app or feature through Windows Defender Firewall"<br>
-3. Click "Change Settings" → "Allow another app"<br>
-4. Browse to python.exe (usually in AppData\\Local\\Programs\\Python)<br>
-5. Check both "Private" and "Public" networks
-            """),
-
-            ("🌐 Network Diagnostics", """
-<b>Check Your IP Address:</b><br>
-• Open Command Prompt (cmd)<br>
-• Type: ipconfig<br>
-• Look for "Wireless LAN adapter Wi-Fi" section<br>
-• Use the IPv4 Address shown<br><br>
-
-<b>Test Server Locally:</b><br>
-• Open http://localhost:3000 in your browser<br>
-• If this doesn't work, the server has an issue<br>
-• If it works, the problem is network/firewall related<br><br>
-
-<b>Test from Another Computer:</b><br>
-• Try connecting from another device on the same network<br>
-• This helps isolate phone-specific issues
-            """),
-
-            ("📋 Requirements", """
-<b>Software Requirements:</b><br>
-• Python 3.6 or higher<br>
-• PyQt6: pip install PyQt6<br>
-• pynput: pip install pynput<br><br>
-
-<b>Network Requirements:</b><br>
-• WiFi network (both devices connected)<br>
-• Windows network profile set to "Private"<br>
-• Firewall configured to allow connections<br><br>
-
-<b>Supported Devices:</b><br>
-• Any device with a web browser<br>
-• iOS Safari, Android Chrome, Desktop browsers<br>
-• Works on tablets and phones
-            """),
-
-            ("⚙️ Advanced Settings", """
-<b>Change Port:</b><br>
-• Default port is 3000<br>
-• If blocked, try 8080, 8000, or 5000<br>
-• Edit the source code to change port<br><br>
-
-<b>Security Notes:</b><br>
-• Server allows anyone on your network to control your mouse<br>
-• Only run on trusted networks<br>
-• Stop the server when not in use<br><br>
-
-<b>Performance Tips:</b><br>
-• Close unnecessary applications for better responsiveness<br>
-• Use 5GHz WiFi if available (faster than 2.4GHz)<br>
-• Keep phone close to router for better signal
-            """)
-        ]
-
-        for title, content in help_sections:
-            group = QGroupBox(title)
-            group_layout = QVBoxLayout(group)
-
-            label = QLabel(content)
-            label.setWordWrap(True)
-            label.setTextFormat(Qt.TextFormat.RichText)
-            label.setStyleSheet("padding: 10px; line-height: 1.4;")
-            group_layout.addWidget(label)
-
-            scroll_layout.addWidget(group)
-
-        scroll_layout.addStretch()
-        scroll.setWidget(scroll_content)
-        scroll.setWidgetResizable(True)
-        layout.addWidget(scroll)
+        """Add the help tab, deferring its contents until it is first opened"""
+        self.help_widget = QWidget()
+        self.help_built = False
+        self.tabs.addTab(self.help_widget, "❓ Help")
+        self.tabs.currentChanged.connect(self.build_help_tab)
+
+    def build_help_tab(self, index):
+        """Fill in the help tab the first time it is selected"""
+        if self.help_built or self.tabs.widget(index) is not self.help_widget:
+            return
+        self.help_built = True
+        layout = QVBoxLayout(self.help_widget)
 
-        self.tabs.addTab(help_widget, "❓ Help")
+        # One document for every section: laid out once and scrolled natively
+        browser = QTextBrowser()
+        browser.setOpenExternalLinks(True)
+        browser.setHtml(HELP_HTML)
+        layout.addWidget(browser)
 
     def init_system_tray(self):
         """Initialize system tray icon"""
         if QSystemTrayIcon.isSystemTrayAvailable():
             self.tray_icon = QSystemTrayIcon(self)
-            self.tray_icon.setIcon(create_icon("#667eea", 32))
+            # Same icon as the window; Qt scales it down for the tray
+            self.tray_icon.setIcon(create_icon("#667eea"))
 
             tray_menu = QMenu()
 
@@ -1183,11 +1945,18 @@ class MouseControllerGUI(QMainWindow):
                                 "Please install it with: pip install pynput")
             return
 
+        try:
+            load_pynput()
+        except ImportError as e:
+            QMessageBox.warning(self, "Missing Dependency",
+                                f"pynput is installed but could not be loaded:\n\n{e}")
+            return
+
         if self.server_thread and self.server_thread.isRunning():
             return
 
-        self.server_thread = ServerThread(port=3000)
-        self.server_thread.log_signal.connect(self.log)
+        self.server_thread = ServerThread(port=DEFAULT_PORT)
+        self.server_thread.log_pending_signal.connect(self.schedule_log_drain)
         self.server_thread.status_signal.connect(self.update_server_status)
         self.server_thread.start()
 
@@ -1200,47 +1969,91 @@ class MouseControllerGUI(QMainWindow):
         if self.server_thread and self.server_thread.isRunning():
             self.server_thread.stop()
             self.server_thread.wait()
+        self.drain_server_logs()
 
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.server_running = False
 
-        self.status_label.setText("Server Status: Stopped")
-        self.status_label.setStyleSheet("color: #e74c3c; padding: 10px;")
-        self.ip_label.setText("IP Address: Not available")
-        self.statusBar().showMessage("Server stopped")
+        self.update_server_status("stopped", "")
 
     def update_server_status(self, status, ip):
         """Update server status display"""
+        display = SERVER_STATUS_DISPLAY.get(status)
+        if display is None:
+            return
+        label, style, ip_text, bar_text = display
+        port = self.server_thread.port if self.server_thread else DEFAULT_PORT
+
+        self.status_label.setText(label)
+        # Qt re-parses a stylesheet on every set, so only set it when the colour changes
+        if self.status_label.styleSheet() != style:
+            self.status_label.setStyleSheet(style)
+        self.ip_label.setText(ip_text.format(ip=ip, port=port))
+        self.statusBar().showMessage(bar_text.format(ip=ip, port=port))
+
         if status == "running":
-            self.status_label.setText("Server Status: Running ✅")
-            self.status_label.setStyleSheet("color: #27ae60; padding: 10px;")
-            self.ip_label.setText(f"📱 Phone URL: http://{ip}:3000")
-            self.statusBar().showMessage(f"Server running on {ip}:3000")
             self.current_ip = ip
+            self.ip_refresh_timer.start()
         elif status == "error":
-            self.status_label.setText("Server Status: Error ❌")
-            self.status_label.setStyleSheet("color: #e74c3c; padding: 10px;")
-            self.ip_label.setText("IP Address: Error occurred")
-            self.statusBar().showMessage("Server error occurred")
             self.start_btn.setEnabled(True)
             self.stop_btn.setEnabled(False)
         elif status == "stopped":
-            self.status_label.setText("Server Status: Stopped")
-            self.status_label.setStyleSheet("color: #e74c3c; padding: 10px;")
-            self.ip_label.setText("IP Address: Not available")
-            self.statusBar().showMessage("Server stopped")
+            self.ip_refresh_timer.stop()
+
+    def refresh_server_ip(self):
+        """Check whether the server's local IP has changed"""
+        if self.server_thread and self.server_thread.running:
+            self.server_thread.refresh_ip()
 
     def log(self, message):
         """Add message to logs"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}"
-        self.logs_text.append(formatted_message)
+        timestamp = time.strftime(LOG_TIME_FORMAT)
+        self.append_logs(f"[{timestamp}] {message}")
 
-        # Auto-scroll to bottom
-        cursor = self.logs_text.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        self.logs_text.setTextCursor(cursor)
+    def schedule_log_drain(self):
+        """Drain right away, then at most once per throttle interval"""
+        if self.log_throttle.isActive():
+            self.log_drain_requested = True
+            return
+        self.drain_server_logs()
+        self.log_throttle.start()
+
+    def log_throttle_elapsed(self):
+        """Run the trailing drain if more lines arrived during the interval"""
+        if self.log_drain_requested:
+            self.log_drain_requested = False
+            self.drain_server_logs()
+            self.log_throttle.start()
+
+    def drain_server_logs(self):
+        """Append all queued server log lines in a single update"""
+        if not self.server_thread:
+            return
+
+        # Reset before draining so lines queued from here on notify again
+        self.server_thread.log_pending = False
+        queue = self.server_thread.log_queue
+        lines = []
+        last_second, timestamp = None, ""
+        while queue:
+            created, message = queue.popleft()
+            # Lines from the same second share one formatted timestamp
+            second = int(created)
+            if second != last_second:
+                last_second = second
+                timestamp = time.strftime(LOG_TIME_FORMAT, time.localtime(second))
+            lines.append(f"[{timestamp}] {message}")
+
+        if lines:
+            self.append_logs("\n".join(lines))
+
+    def append_logs(self, text):
+        """Append text to the logs display and keep it scrolled to the end"""
+        # Plain-text insert at the end skips append()'s rich-text detection
+        # and leaves the cursor at the bottom, which also auto-scrolls
+        self.logs_text.moveCursor(QTextCursor.MoveOperation.End)
+        self.logs_text.insertPlainText(text + "\n")
 
     def clear_logs(self):
         """Clear the logs display"""
@@ -1272,8 +2085,36 @@ class MouseControllerGUI(QMainWindow):
         QApplication.quit()
 
 
+# Dark theme colours, applied through a palette so Fusion keeps drawing natively
+DARK_PALETTE_COLORS = (
+    (QPalette.ColorRole.Window, (53, 53, 53)),
+    (QPalette.ColorRole.WindowText, (255, 255, 255)),
+    (QPalette.ColorRole.Base, (25, 25, 25)),
+    (QPalette.ColorRole.AlternateBase, (53, 53, 53)),
+    (QPalette.ColorRole.ToolTipBase, (0, 0, 0)),
+    (QPalette.ColorRole.ToolTipText, (255, 255, 255)),
+    (QPalette.ColorRole.Text, (255, 255, 255)),
+    (QPalette.ColorRole.Button, (53, 53, 53)),
+    (QPalette.ColorRole.ButtonText, (255, 255, 255)),
+    (QPalette.ColorRole.BrightText, (255, 0, 0)),
+    (QPalette.ColorRole.Link, (42, 130, 218)),
+    (QPalette.ColorRole.Highlight, (42, 130, 218)),
+    (QPalette.ColorRole.HighlightedText, (0, 0, 0)),
+)
+
+
+def create_dark_palette():
+    """Build the dark theme palette from DARK_PALETTE_COLORS"""
+    palette = QPalette()
+    for role, rgb in DARK_PALETTE_COLORS:
+        palette.setColor(role, QColor(*rgb))
+    return palette
+
+
 def main():
     """Main application entry point"""
+    # Merge bursts of mouse-move/resize events in the GUI's own event loop
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents, True)
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)  # Keep running in system tray
 
@@ -1286,24 +2127,7 @@ def main():
     app.setStyle('Fusion')
 
     # Dark theme palette
-    from PyQt6.QtGui import QPalette
-    from PyQt6.QtCore import Qt
-
-    palette = QPalette()
-    palette.setColor(QPalette.ColorRole.Window, QColor(53, 53, 53))
-    palette.setColor(QPalette.ColorRole.WindowText, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.Base, QColor(25, 25, 25))
-    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(53, 53, 53))
-    palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(0, 0, 0))
-    palette.setColor(QPalette.ColorRole.ToolTipText, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.Text, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
-    palette.setColor(QPalette.ColorRole.ButtonText, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0))
-    palette.setColor(QPalette.ColorRole.Link, QColor(42, 130, 218))
-    palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
-    palette.setColor(QPalette.ColorRole.HighlightedText, QColor(0, 0, 0))
-    app.setPalette(palette)
+    app.setPalette(create_dark_palette())
 
     # Create and show main window
     window = MouseControllerGUI()